@@ -7,12 +7,15 @@ type stub files (.pyi) for all public modules and classes by
 introspecting the loaded modules without reading source code.
 """
 
-import argparse
 import importlib
-import inspect
-import pkgutil
+import io
+import os
 import sys
+from collections.abc import Iterable, Iterator
+from functools import cache
+from operator import itemgetter
 from pathlib import Path
+from types import ClassMethodDescriptorType
 from typing import Any
 
 # Dunder methods actually defined in Raysect source code (.pyx/.pxd files)
@@ -63,26 +66,48 @@ COMMON_DUNDER_METHODS_ORDERED = [
 ]
 
 # Create a set for quick lookup
-COMMON_DUNDER_METHODS_SET = set(COMMON_DUNDER_METHODS_ORDERED)
+COMMON_DUNDER_METHODS_SET = frozenset(COMMON_DUNDER_METHODS_ORDERED)
+
+# Map each dunder method to its position for sorting
+COMMON_DUNDER_METHODS_INDEX = {name: i for i, name in enumerate(COMMON_DUNDER_METHODS_ORDERED)}
+
+# Fallback stubs for callables whose signature cannot be retrieved
+_FALLBACK_INIT = "    def {}(self, *args: Any, **kwargs: Any) -> None: ..."
+_FALLBACK_METHOD = "    def {}(self, *args: Any, **kwargs: Any) -> Any: ..."
+_FALLBACK_FUNCTION = "def {}(*args: Any, **kwargs: Any) -> Any: ..."
+
+# Stubs older than this script are out of date too, since its output may have changed
+_GENERATOR_MTIME = Path(__file__).stat().st_mtime
+
+# Class stub bodies generated so far in this process, keyed by class (which keeps it alive)
+_CLASS_STUB_CACHE: dict[type, str] = {}
 
 
 def main():
     """Main entry point for stub generation."""
+    import argparse
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description="Generate type stubs for the Raysect library",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""Examples:
-  %(prog)s                    # Generate new files only (default)
-  %(prog)s --overwrite        # Overwrite existing files
-  %(prog)s -o output/dir      # Specify output directory
-  %(prog)s --overwrite -o .   # Overwrite in current directory""",
+  %(prog)s                     # Generate new files only (default)
+  %(prog)s --overwrite         # Overwrite existing files
+  %(prog)s -o output/dir       # Specify output directory
+  %(prog)s --overwrite -o .    # Overwrite in current directory
+  %(prog)s --overwrite --force # Overwrite even up-to-date stubs
+  %(prog)s -j 1                # Generate stubs serially""",
     )
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing .pyi files (default: only create new files)")
     parser.add_argument("-o", "--output", type=Path, default=Path("src/raysect-stubs"), help="Output directory for stub files (default: src/raysect-stubs)")
+    parser.add_argument("--force", action="store_true", help="With --overwrite, also regenerate stubs that are newer than their module and this script")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
+    parser.add_argument("-j", "--jobs", type=positive_int, default=os.cpu_count(), help="Number of worker processes used for generation (default: number of CPUs)")
 
     args = parser.parse_args()
+    if args.force and not args.overwrite:
+        parser.error("--force requires --overwrite")
 
     print("Raysect Stub Generator")
     print("=====================")
@@ -101,65 +126,129 @@ def main():
     stub_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"Generating stubs in: {stub_dir}")
-    print(f"Overwrite mode: {'enabled' if args.overwrite else 'disabled (new files only)'}")
+    print(f"Overwrite mode: {'enabled' if args.overwrite else 'disabled (new files only)'}{' (forced)' if args.overwrite and args.force else ''}")
+    print(f"Worker processes: {args.jobs}")
     if args.verbose:
         print("Verbose mode enabled")
     print("Scanning modules and extracting classes/functions...")
 
-    # Discover all modules (excluding tests)
-    modules = discover_modules()
+    # Discover all modules (excluding tests), streamed so generation starts during discovery
+    modules = ensure_stub_dirs(discover_modules(), stub_dir)
+
+    # Generate stubs for each module in parallel (each module writes an independent file)
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
 
-    # Generate stubs for each module
     generated_count = 0
     skipped_count = 0
-    for module_name in modules:
-        result = generate_module_stub(module_name, stub_dir, args.overwrite, args.verbose)
-        if result == "generated":
-            generated_count += 1
-        elif result == "skipped":
-            skipped_count += 1
+    up_to_date_count = 0
+    failed_count = 0
+    generate = partial(generate_module_stub, stub_dir=stub_dir, overwrite=args.overwrite, verbose=args.verbose, force=args.force)
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        # Workers return their report line, so that output is printed from a single process
+        for result, message in executor.map(generate, modules, chunksize=8):
+            if message:
+                print(message)
+            if result == "generated":
+                generated_count += 1
+            elif result == "skipped":
+                skipped_count += 1
+            elif result == "up-to-date":
+                up_to_date_count += 1
+            elif result == "failed":
+                failed_count += 1
 
     print("\nStub generation complete!")
     print(f"Generated: {generated_count} stub files")
     if skipped_count > 0:
         print(f"Skipped: {skipped_count} existing files (use --overwrite to replace)")
+    if up_to_date_count > 0:
+        print(f"Up to date: {up_to_date_count} stub files (use --force to regenerate)")
+    if failed_count > 0:
+        print(f"Failed: {failed_count} modules")
     print("Note: Type annotations may need manual refinement.")
 
 
-def discover_modules() -> list[str]:
-    """Discover all non-test modules in raysect package."""
-    import raysect
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer command line argument."""
+    import argparse
 
-    modules = []
-    # Always include the main module
-    modules.append("raysect")
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
-    # Walk through all submodules
-    for _, modname, _ in pkgutil.walk_packages(raysect.__path__, raysect.__name__ + "."):
-        # Skip test modules/packages
-        if ".test" in modname or modname.endswith(".tests"):
-            continue
-        modules.append(modname)
 
-    return sorted(modules)
+def discover_modules() -> Iterator[tuple[str, bool]]:
+    """Discover all non-test modules in raysect package.
+
+    (name, is_package) pairs are yielded as soon as they are found, in no particular order.
+    """
+    import pkgutil
+
+    import raysect
+
+    # Always include the main module
+    yield "raysect", True
+
+    # Walk through all submodules, pruning test packages before they are imported
+    stack = [(raysect.__path__, raysect.__name__ + ".")]
+    while stack:
+        path, prefix = stack.pop()
+        for _, modname, ispkg in pkgutil.iter_modules(path, prefix):
+            # Skip test modules/packages
+            if ".test" in modname or modname.endswith(".tests"):
+                continue
+            yield modname, ispkg
+
+            # Packages must be imported to find their children
+            if ispkg:
+                try:
+                    package = importlib.import_module(modname)
+                except Exception:
+                    continue
+                stack.append((package.__path__, modname + "."))
+
+
+def ensure_stub_dirs(modules: Iterable[tuple[str, bool]], stub_dir: Path) -> Iterator[str]:
+    """Pass module names through, creating the directory each stub is written to once.
+
+    Directories are created once per package rather than once per stub file
+    (e.g. raysect.core.math.vector -> raysect-stubs/core/math, and the package
+    raysect.core.math -> raysect-stubs/core/math for its ``__init__.pyi``).
+    """
+    created = set()
+    for module_name, ispkg in modules:
+        parts = module_name.split(".")[1:]
+        directory = stub_dir.joinpath(*(parts if ispkg else parts[:-1]))
+        if directory not in created:
+            directory.mkdir(parents=True, exist_ok=True)
+            created.add(directory)
+        yield module_name
 
 
-def generate_module_stub(module_name: str, stub_dir: Path, overwrite: bool = False, verbose: bool = False) -> str:
+def generate_module_stub(module_name: str, stub_dir: Path, overwrite: bool = False, verbose: bool = False, force: bool = False) -> tuple[str, str | None]:
     """Generate stub file for a specific module.
 
     Returns:
+        A (status, message) pair, where status is
         "generated" if file was created/overwritten
         "skipped" if file exists and overwrite is False
+        "up-to-date" if file is newer than both the module's source file
+            and this script, and force is False
         "failed" if generation failed
+        and message is the line to report for it (None if there is nothing to report).
     """
     try:
         # Import the module
         module = importlib.import_module(module_name)
 
-        # Create directory structure
+        # Resolve the stub file path (its directory is created by main())
         if module_name == "raysect":
             stub_file = stub_dir / "__init__.pyi"
-            stub_file.parent.mkdir(parents=True, exist_ok=True)
         else:
             # Convert module name to path (e.g., raysect.core.math -> raysect-stubs/core/math)
             relative_path = module_name.replace("raysect.", "").replace(".", "/")
@@ -167,62 +256,65 @@ def generate_module_stub(module_name: str, stub_dir: Path, overwrite: bool = Fal
                 stub_file = stub_dir / relative_path / "__init__.pyi"
             else:  # It's a module
                 stub_file = stub_dir / f"{relative_path}.pyi"
-            stub_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stat the stub file once: it tells both whether it exists and how old it is
+        try:
+            stub_mtime = stub_file.stat().st_mtime
+        except FileNotFoundError:
+            stub_mtime = None
+        existed = stub_mtime is not None
 
         # Check if file exists and handle overwrite logic
-        if stub_file.exists() and not overwrite:
-            if verbose:
-                print(f"  Skipped (exists): {stub_file}")
-            return "skipped"
+        if existed and not overwrite:
+            return "skipped", f"  Skipped (exists): {stub_file}" if verbose else None
+
+        # Skip stubs that are already up to date with the module's source file and this script
+        source_file = getattr(module, "__file__", None)
+        if not force and source_file and existed and stub_mtime >= max(os.path.getmtime(source_file), _GENERATOR_MTIME):
+            return "up-to-date", f"  Skipped (up to date): {stub_file}" if verbose else None
 
         # Generate stub content
         content = generate_stub_content(module, module_name)
 
-        # Write stub file
-        stub_file.write_text(content)
-        action = "Overwritten" if stub_file.exists() and overwrite else "Generated"
-        print(f"  {action}: {stub_file}")
-        return "generated"
+        # Write stub file (encoded once, bypassing the text I/O layer)
+        stub_file.write_bytes(content.encode("utf-8"))
+        action = "Overwritten" if existed else "Generated"
+        return "generated", f"  {action}: {stub_file}"
 
     except Exception as e:
-        print(f"  Warning: Failed to process {module_name}: {e}")
-        return "failed"
+        return "failed", f"  Warning: Failed to process {module_name}: {e}"
 
 
 def generate_stub_content(module: Any, module_name: str) -> str:
     """Generate stub content for a module."""
-    lines = [
-        f'"""Type stubs for {module_name}"""',
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(f'"""Type stubs for {module_name}"""\n\n')
 
     # Get module docstring if available
     if hasattr(module, "__doc__") and module.__doc__:
         # Add first line of docstring as comment
         first_line = module.__doc__.strip().split("\n")[0]
         if first_line:
-            lines.append(f"# {first_line}")
-            lines.append("")
+            w(f"# {first_line}\n\n")
 
     # Collect imports needed
     imports = set()
 
-    # Get all public members
-    members = get_public_members(module)
+    # Get all public members defined in this module
+    members = get_public_members(module, module_name)
 
     # Process classes
     classes = []
     for name, obj in members.get("classes", []):
-        if obj.__module__ == module_name:
-            class_stub = generate_class_stub(obj, name, imports)
-            classes.append(class_stub)
+        class_stub = generate_class_stub(obj, name, imports)
+        classes.append(class_stub)
 
     # Process functions
     functions = []
     for name, obj in members.get("functions", []):
-        if obj.__module__ == module_name:
-            func_stub = generate_function_stub(obj, name, imports)
-            functions.append(func_stub)
+        func_stub = generate_function_stub(obj, name, imports)
+        functions.append(func_stub)
 
     # Process constants and variables
     constants = []
@@ -232,45 +324,58 @@ def generate_stub_content(module: Any, module_name: str) -> str:
 
     # Add common imports if we have content
     if classes or functions or constants:
-        lines.append("from typing import Any")
-        lines.append("")
+        w("from typing import Any\n\n")
 
     # Add constants
-    if constants:
-        lines.extend(constants)
-        lines.append("")
+    for const_stub in constants:
+        w(const_stub)
+        w("\n")
 
     # Add functions
     if functions:
-        lines.extend(functions)
-        lines.append("")
+        if constants:
+            w("\n")
+        for func_stub in functions:
+            w(func_stub)
+            w("\n")
 
-    # Add classes
+    # Add classes (each class stub already ends with a newline)
     if classes:
-        lines.extend(classes)
+        if constants or functions:
+            w("\n")
+        for i, class_stub in enumerate(classes):
+            if i:
+                w("\n")
+            w(class_stub)
 
     # If nothing was found, add a placeholder
     if not classes and not functions and not constants:
-        lines.append("# No public API detected - may need manual inspection")
+        w("# No public API detected - may need manual inspection\n")
+
+    return buf.getvalue()
 
-    return "\n".join(lines)
 
+def get_public_members(module: Any, module_name: str) -> dict[str, list]:
+    """Extract public members from a module.
+
+    Classes and functions re-exported from other modules are skipped.
+    """
+    import inspect
 
-def get_public_members(module: Any) -> dict[str, list]:
-    """Extract public members from a module."""
     classes = []
     functions = []
     constants = []
 
-    for name, obj in inspect.getmembers(module):
-        # Skip private members
-        if name.startswith("_"):
-            continue
-
+    # Read the module namespace directly rather than through inspect.getmembers (no getattr per name)
+    for name, obj in sorted(_iter_public(vars(module)), key=itemgetter(0)):
         if inspect.isclass(obj):
+            if getattr(obj, "__module__", None) != module_name:
+                continue
             classes.append((name, obj))
-        elif inspect.isfunction(obj) or inspect.isbuiltin(obj) or callable(obj):
-            # Include Cython functions and other callables
+        elif inspect.isroutine(obj):
+            # Include Python, builtin and Cython functions (but not other callables such as instances)
+            if getattr(obj, "__module__", None) != module_name:
+                continue
             functions.append((name, obj))
         elif not inspect.ismodule(obj):
             # Treat as constant/variable
@@ -281,40 +386,77 @@ def get_public_members(module: Any) -> dict[str, list]:
 
 def generate_class_stub(cls: Any, class_name: str, imports: set[str]) -> str:
     """Generate stub for a class."""
-    lines = [f"class {class_name}:"]
+    # The class body does not depend on the name the class is bound to, so it is
+    # generated once per class (e.g. aliases like ``Foo = Bar`` reuse it)
+    body = _CLASS_STUB_CACHE.get(cls)
+    if body is None:
+        body = _CLASS_STUB_CACHE[cls] = _generate_class_body(cls)
+    return f"class {class_name}:\n{body}"
+
+
+def _generate_class_body(cls: Any) -> str:
+    """Generate the indented body of a class stub."""
+    buf = io.StringIO()
+    w = buf.write
 
     # Add docstring if available
     if hasattr(cls, "__doc__") and cls.__doc__:
         first_line = cls.__doc__.strip().split("\n")[0]
         if first_line:
-            lines.append(f'    """{first_line}"""')
+            w(f'    """{first_line}"""\n')
 
     # Get class methods and properties
+    methods, properties = _collect_class_members(cls)
+
+    # Add properties
+    if properties:
+        for prop_stub in properties:
+            w(prop_stub)
+            w("\n")
+        w("\n")
+
+    # Add methods (already sorted by dunder method order, then regular methods)
+    for method_stub in methods:
+        w(method_stub)
+        w("\n")
+
+    # If no methods found, add pass
+    if not methods and not properties:
+        w("    ...\n")
+
+    return buf.getvalue()
+
+
+def _collect_class_members(cls: Any) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Collect the method and property stub lines of a class.
+
+    Returns:
+        A ``(methods, properties)`` tuple of stub lines, with methods sorted
+        by dunder method order, then regular methods.
+    """
+    import inspect
+
+    imports: set[str] = set()
     methods = []
     properties = []
 
-    # Get methods defined directly in the class dict (not inherited)
-    class_dict_methods = set()
-    if hasattr(cls, "__dict__"):
-        class_dict_methods = set(cls.__dict__.keys())
-
-    for name, member in inspect.getmembers(cls):
-        # Include dunder methods (like __getitem__, __add__, etc.) but exclude most private methods
-        if name.startswith("_") and not (name.startswith("__") and name.endswith("__")):
-            continue
+    # Get methods defined directly in the class dict (not inherited); lookups are O(1) without copying it
+    class_dict = getattr(cls, "__dict__", {})
 
+    # Private members and uncommon dunder methods are already excluded by the namespace walk
+    for name, member in _iter_class_namespace(cls):
         if callable(member) and not inspect.isdatadescriptor(member):
             # For dunder methods, be more selective - only include common ones that are likely user-defined
             if name.startswith("__") and name.endswith("__"):
                 # Use global definition of dunder methods
-                if name in COMMON_DUNDER_METHODS_SET and name in class_dict_methods:
+                if name in COMMON_DUNDER_METHODS_SET and name in class_dict:
                     method_stub = generate_method_stub(member, name, imports)
-                    methods.append(method_stub)
+                    methods.append((_method_sort_key(name), method_stub))
             # For non-dunder methods, include if they're defined in this class or module
             else:
                 should_include = False
                 # Check if method is in class dict (defined directly in class)
-                if name in class_dict_methods:
+                if name in class_dict:
                     should_include = True
                 # For Cython methods, check module match
                 elif hasattr(member, "__module__") and member.__module__ == cls.__module__:
@@ -322,88 +464,162 @@ def generate_class_stub(cls: Any, class_name: str, imports: set[str]) -> str:
 
                 if should_include:
                     method_stub = generate_method_stub(member, name, imports)
-                    methods.append(method_stub)
+                    methods.append((_method_sort_key(name), method_stub))
         elif inspect.isdatadescriptor(member) and not name.startswith("_"):
             prop_stub = f"    {name}: Any"
             properties.append(prop_stub)
 
-    # Add properties
-    if properties:
-        lines.extend(properties)
-        lines.append("")
-
-    # Add methods (sorted by dunder method order, then regular methods)
-    if methods:
-        # Use global ordered list for sorting
-        def method_sort_key(method_line):
-            # Extract method name from the line (e.g., "    def __init__(..." -> "__init__")
-            method_name = method_line.strip().split("(")[0].split()[-1]
-
-            if method_name in COMMON_DUNDER_METHODS_ORDERED:
-                return (0, COMMON_DUNDER_METHODS_ORDERED.index(method_name))  # Dunder methods in defined order
-            elif method_name.startswith("__") and method_name.endswith("__"):
-                return (1, method_name)  # Other dunder methods (alphabetical)
-            else:
-                return (2, method_name)  # Regular methods (alphabetical)
+    methods.sort(key=itemgetter(0))
+    properties.sort()
+    return tuple(method_stub for _, method_stub in methods), tuple(properties)
 
-        methods.sort(key=method_sort_key)
-        lines.extend(methods)
 
-    # If no methods found, add pass
-    if not methods and not properties:
-        lines.append("    ...")
+def _method_sort_key(method_name: str) -> tuple[int, int | str]:
+    """Sort key placing dunder methods in the global defined order, then other methods."""
+    index = COMMON_DUNDER_METHODS_INDEX.get(method_name)
+    if index is not None:
+        return (0, index)  # Dunder methods in defined order
+    elif method_name.startswith("__") and method_name.endswith("__"):
+        return (1, method_name)  # Other dunder methods (alphabetical)
+    else:
+        return (2, method_name)  # Regular methods (alphabetical)
+
 
-    lines.append("")
-    return "\n".join(lines)
+def _iter_public(namespace: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """Iterate over the public ``(name, object)`` pairs of a namespace."""
+    return ((name, obj) for name, obj in namespace.items() if not name.startswith("_"))
+
+
+def _iter_class_namespace(cls: Any) -> Iterator[tuple[str, Any]]:
+    """Iterate over the public ``(name, member)`` pairs of a class, including inherited ones.
+
+    Unlike ``inspect.getmembers``, the class ``__dict__`` of each base in the MRO is
+    read directly (as ``inspect.getattr_static`` does), so data descriptors (e.g. Cython
+    properties) are never invoked. Private members and dunder methods outside
+    ``COMMON_DUNDER_METHODS_SET`` are skipped before being touched; only the remaining
+    class/static method wrappers are bound to recover the underlying callable.
+    """
+    seen = set()
+    for klass in getattr(cls, "__mro__", (cls,)):
+        for name, member in vars(klass).items():
+            if name in seen or (name.startswith("_") and name not in COMMON_DUNDER_METHODS_SET):
+                continue
+            seen.add(name)
+            if isinstance(member, (classmethod, staticmethod, ClassMethodDescriptorType)):
+                member = member.__get__(None, cls)
+            yield name, member
 
 
 def generate_method_stub(method: Any, method_name: str, imports: set[str]) -> str:
     """Generate stub for a method."""
     try:
-        # Try to get signature
-        sig = inspect.signature(method)
-        params = []
-
-        for param_name, param in sig.parameters.items():
-            if param.annotation != param.empty:
-                # Has annotation - try to use it
-                params.append(f"{param_name}: Any")  # Simplified for now
-            else:
-                params.append(param_name)
-
-        params_str = ", ".join(params)
-        return_annotation = " -> Any" if sig.return_annotation != sig.empty else ""
-
-        return f"    def {method_name}({params_str}){return_annotation}: ..."
+        return f"    def {method_name}{_sig_params(method)}: ..."
 
     except (ValueError, TypeError):
         # Fallback for built-in methods or methods without signature
-        if method_name == "__init__":
-            return f"    def {method_name}(self, *args: Any, **kwargs: Any) -> None: ..."
-        else:
-            return f"    def {method_name}(self, *args: Any, **kwargs: Any) -> Any: ..."
+        return (_FALLBACK_INIT if method_name == "__init__" else _FALLBACK_METHOD).format(method_name)
 
 
 def generate_function_stub(func: Any, func_name: str, imports: set[str]) -> str:
     """Generate stub for a function."""
     try:
-        sig = inspect.signature(func)
-        params = []
+        return f"def {func_name}{_sig_params(func)}: ..."
 
-        for param_name, param in sig.parameters.items():
-            if param.annotation != param.empty:
-                params.append(f"{param_name}: Any")  # Simplified
-            else:
-                params.append(param_name)
+    except (ValueError, TypeError):
+        # Fallback for built-in functions
+        return _FALLBACK_FUNCTION.format(func_name)
 
-        params_str = ", ".join(params)
-        return_annotation = " -> Any" if sig.return_annotation != sig.empty else ""
 
-        return f"def {func_name}({params_str}){return_annotation}: ..."
+@cache
+def _sig_params(func: Any) -> str:
+    """Format the parameter list and return annotation of a callable.
 
-    except (ValueError, TypeError):
-        # Fallback for built-in functions
-        return f"def {func_name}(*args: Any, **kwargs: Any) -> Any: ..."
+    Raises:
+        ValueError, TypeError: If no signature can be retrieved.
+    """
+    # Fast path: builtins and Cython methods carry their C signature as a plain string
+    text_sig = getattr(func, "__text_signature__", None)
+    if text_sig:
+        try:
+            return _parse_text_signature(text_sig, getattr(func, "__self__", None) is not None)
+        except SyntaxError:
+            pass  # Not valid Python syntax, let inspect.signature deal with it
+
+    import inspect
+
+    sig = inspect.signature(func)
+    return_annotation = " -> Any" if sig.return_annotation != sig.empty else ""
+
+    return f"({_format_arguments(_signature_arguments(sig))}){return_annotation}"
+
+
+def _signature_arguments(sig: Any) -> Any:
+    """Convert an ``inspect.Signature`` to an ``ast.arguments`` node.
+
+    Annotations are simplified to ``Any``, like for the rest of the stub.
+    """
+    import ast
+    import inspect
+
+    arguments = ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+    for param in sig.parameters.values():
+        arg = ast.arg(param.name, None if param.annotation is param.empty else ast.Name("Any"))
+        default = None if param.default is param.empty else ast.Constant(...)
+        if param.kind is inspect.Parameter.POSITIONAL_ONLY:
+            arguments.posonlyargs.append(arg)
+        elif param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            arguments.args.append(arg)
+        elif param.kind is inspect.Parameter.VAR_POSITIONAL:
+            arguments.vararg = arg
+        elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+            arguments.kwonlyargs.append(arg)
+            arguments.kw_defaults.append(default)
+            continue
+        else:
+            arguments.kwarg = arg
+        # Positional defaults always belong to the trailing parameters
+        if default is not None:
+            arguments.defaults.append(default)
+    return arguments
+
+
+def _format_arguments(arguments: Any) -> str:
+    """Format an ``ast.arguments`` node as a stub parameter list.
+
+    Default values are written as ``...``, since their expressions may refer to
+    names (e.g. ``sys.maxsize``) that the stub does not import.
+    """
+    import ast
+
+    ellipsis = ast.Constant(...)
+    arguments.defaults = [ellipsis for _ in arguments.defaults]
+    arguments.kw_defaults = [None if default is None else ellipsis for default in arguments.kw_defaults]
+    return ast.unparse(arguments)
+
+
+@cache
+def _parse_text_signature(text_sig: str, bound: bool) -> str:
+    """Format a ``__text_signature__`` string (e.g. ``"($self, x, /)"``) as a parameter list.
+
+    The string is parsed as the parameter list of a synthesized function, so each distinct
+    signature is only parsed once. A leading ``$``-prefixed parameter denotes the implicit
+    ``self``/``module``/``type`` argument: it is dropped when the callable is bound,
+    otherwise the ``$`` marker is removed.
+
+    Raises:
+        SyntaxError: If the signature is not valid Python syntax.
+    """
+    import ast
+
+    implicit_first = text_sig.startswith("($")
+    if implicit_first:
+        text_sig = "(" + text_sig[2:]
+
+    args = ast.parse(f"def _{text_sig}: pass").body[0].args
+    if implicit_first and bound:
+        (args.posonlyargs or args.args).pop(0)
+
+    return f"({_format_arguments(args)})"
 
 
 def generate_constant_stub(name: str, obj: Any, imports: set[str]) -> str:
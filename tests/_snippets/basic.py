@@ -0,0 +1,13 @@
+"""Basic imports and usage of the stubs."""
+
+import raysect
+from raysect.core.math import Point3D, Vector3D
+from raysect.core.scenegraph import Node, World
+from raysect.optical import Ray, Spectrum
+from raysect.primitive import Sphere
+
+# Test basic usage
+world = World()
+vector = Vector3D(1.0, 2.0, 3.0)
+point = Point3D(0.0, 0.0, 0.0)
+sphere = Sphere(radius=1.0, parent=world)
@@ -0,0 +1,14 @@
+"""Math operations on vectors and points."""
+
+from raysect.core.math import Point3D, Vector3D
+
+v1 = Vector3D(1.0, 2.0, 3.0)
+v2 = Vector3D(4.0, 5.0, 6.0)
+p1 = Point3D(0.0, 0.0, 0.0)
+
+# These should be valid operations
+v3 = v1 + v2
+v4 = v1 * 2.0
+dot_product = v1.dot(v2)
+cross_product = v1.cross(v2)
+p2 = p1 + v1
@@ -0,0 +1,79 @@
+"""Shared fixtures for raysect stubs tests."""
+
+import json
+import os
+import shutil
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from mypy import api
+
+# Incremental cache shared by every mypy run, so the stubs are analyzed once.
+# It persists across pytest runs (and can be cached in CI), in the git-ignored .mypy_cache.
+# Each pytest-xdist worker gets its own cache, so that concurrent runs do not write the same cache files.
+_CACHE_DIR = Path(__file__).parents[1] / ".mypy_cache" / "tests" / os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+# The warnings enabled by the project's strict mode are irrelevant for snippets.
+MYPY_ARGS = [
+    "--no-error-summary",
+    "--no-warn-unused-ignores",
+    "--no-warn-redundant-casts",
+    "--no-warn-return-any",
+    "--fast-module-lookup",
+    "--cache-dir",
+    str(_CACHE_DIR),
+]
+
+
+def pytest_report_header() -> str:
+    """Report the mypy version, and whether it is compiled with mypyc (interpreted mypy is several times slower)."""
+    import mypy.main
+    import mypy.version
+
+    compiled = "no" if mypy.main.__file__.endswith(".py") else "yes"
+    return f"mypy: {mypy.version.__version__} (compiled: {compiled})"
+
+
+@pytest.fixture(scope="session")
+def mypy_check() -> Callable[..., tuple[str, str, int]]:
+    """Type-check snippet files with mypy.
+
+    Every check reuses mypy's incremental cache, so only the first one pays for
+    analyzing the stubs. The returned callable has the same result as ``api.run``.
+    """
+
+    def check(*paths: Path) -> tuple[str, str, int]:
+        return api.run([*MYPY_ARGS, *map(str, paths)])
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def pyright_check() -> Callable[..., tuple[str, str, int]]:
+    """Type-check snippet files with pyright, skipping the test if it is not installed.
+
+    The returned callable mimics ``api.run``: the report lists error diagnostics only.
+    """
+    pyright = shutil.which("pyright")
+    if pyright is None:
+        pytest.skip("pyright is not installed")
+
+    def check(*paths: Path) -> tuple[str, str, int]:
+        result = subprocess.run([pyright, "--outputjson", *map(str, paths)], capture_output=True, text=True, check=False)
+        try:
+            diagnostics = json.loads(result.stdout)["generalDiagnostics"]
+        except (json.JSONDecodeError, KeyError):
+            # Fatal or configuration error: no JSON report
+            return result.stdout, result.stderr, result.returncode
+        report = "\n".join(f"{d['file']}:{d['range']['start']['line'] + 1}: error: {d['message']}" for d in diagnostics if d["severity"] == "error")
+        return report, result.stderr, result.returncode
+
+    return check
+
+
+@pytest.fixture(params=["mypy", "pyright"])
+def type_check(request: pytest.FixtureRequest) -> Callable[..., tuple[str, str, int]]:
+    """Type-check snippet files with each supported type checker in turn."""
+    return request.getfixturevalue(f"{request.param}_check")
@@ -0,0 +1,60 @@
+"""Tests for the signatures written by the stub generator script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# The script is not part of an importable package
+_SCRIPT = Path(__file__).parents[1] / "scripts" / "generate_stubs.py"
+_spec = importlib.util.spec_from_file_location("generate_stubs", _SCRIPT)
+generate_stubs = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_stubs)
+
+
+def _python_function(a, b=1, /, c=None, *args, d, e=(), **kwargs):
+    """Function without a ``__text_signature__``, formatted by inspect.signature."""
+
+
+def _annotated_function(x: int, y: str = "y") -> int:
+    """Function with annotations, formatted by inspect.signature."""
+    return x
+
+
+@pytest.mark.parametrize(
+    ("method", "name", "expected"),
+    [
+        # Unbound: "$self" is kept as "self"
+        (list.insert, "insert", "    def insert(self, index, object, /): ..."),
+        (object.__init__, "__init__", "    def __init__(self, /, *args, **kwargs): ..."),
+        # Default expressions are not copied, as they may refer to names the stub does not import
+        (list.index, "index", "    def index(self, value, start=..., stop=..., /): ..."),
+        # Bound classmethod: "$type" is dropped
+        (dict.fromkeys, "fromkeys", "    def fromkeys(iterable, value=..., /): ..."),
+        # "<unrepresentable>" defaults are not valid syntax, and inspect.signature rejects them too
+        (str.maketrans, "maketrans", "    def maketrans(self, *args: Any, **kwargs: Any) -> Any: ..."),
+    ],
+)
+def test_method_stub(method, name, expected):
+    """Test method stubs generated from ``__text_signature__``."""
+    assert generate_stubs.generate_method_stub(method, name, set()) == expected
+
+
+@pytest.mark.parametrize(
+    ("func", "name", "expected"),
+    [
+        # Bound to the builtins module: "$module" is dropped
+        (len, "len", "def len(obj, /): ..."),
+        (str.maketrans, "maketrans", "def maketrans(*args: Any, **kwargs: Any) -> Any: ..."),
+        # Without a text signature, inspect.signature gives the same form
+        (_python_function, "f", "def f(a, b=..., /, c=..., *args, d, e=..., **kwargs): ..."),
+        (_annotated_function, "g", "def g(x: Any, y: Any=...) -> Any: ..."),
+    ],
+)
+def test_function_stub(func, name, expected):
+    """Test function stubs generated from ``__text_signature__`` or ``inspect.signature``."""
+    assert generate_stubs.generate_function_stub(func, name, set()) == expected
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))